@@ -2,46 +2,75 @@ import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 
+from profiling import profiled, stage
+
+def find_number_columns(data):
+    """Names of the int and float columns"""
+    number_columns = []
+    for col in data.columns:
+        if data[col].dtype in ['int64', 'float64']:
+            number_columns.append(col)
+    return number_columns
+
+def column_stats(data, number_columns):
+    """Average, highest, lowest and middle value of each number column"""
+    stats = {}
+    for col in number_columns:
+        stats[col] = {
+            'mean': data[col].mean(),
+            'max': data[col].max(),
+            'min': data[col].min(),
+            'median': data[col].median(),
+        }
+    return stats
+
+def show_results(data, number_columns, stats, text_area):
+    """Write the analysis report into the text area"""
+    # Clear previous results
+    text_area.delete(1.0, tk.END)
+    
+    # Show basic info
+    text_area.insert(tk.END, f"File loaded successfully!\n")
+    text_area.insert(tk.END, f"Number of rows: {len(data)}\n")
+    text_area.insert(tk.END, f"Number of columns: {len(data.columns)}\n\n")
+    
+    # Show column names
+    text_area.insert(tk.END, "Column names:\n")
+    for i, col in enumerate(data.columns, 1):
+        text_area.insert(tk.END, f"{i}. {col}\n")
+    text_area.insert(tk.END, "\n")
+    
+    if len(number_columns) == 0:
+        text_area.insert(tk.END, "No number columns found to analyze.\n")
+        return
+    
+    # Analyze each number column
+    text_area.insert(tk.END, "Analysis of number columns:\n")
+    text_area.insert(tk.END, "=" * 40 + "\n")
+    
+    for col in number_columns:
+        text_area.insert(tk.END, f"\nColumn: {col}\n")
+        text_area.insert(tk.END, f"Average: {stats[col]['mean']:.2f}\n")
+        text_area.insert(tk.END, f"Highest: {stats[col]['max']}\n")
+        text_area.insert(tk.END, f"Lowest: {stats[col]['min']}\n")
+        text_area.insert(tk.END, f"Middle value: {stats[col]['median']:.2f}\n")
+
+@profiled
 def analyze_csv_file(file_path, text_area):
     """Read and analyze a CSV file"""
     try:
         # Read the CSV file
-        data = pd.read_csv(file_path)
-        
-        # Clear previous results
-        text_area.delete(1.0, tk.END)
-        
-        # Show basic info
-        text_area.insert(tk.END, f"File loaded successfully!\n")
-        text_area.insert(tk.END, f"Number of rows: {len(data)}\n")
-        text_area.insert(tk.END, f"Number of columns: {len(data.columns)}\n\n")
-        
-        # Show column names
-        text_area.insert(tk.END, "Column names:\n")
-        for i, col in enumerate(data.columns, 1):
-            text_area.insert(tk.END, f"{i}. {col}\n")
-        text_area.insert(tk.END, "\n")
+        with stage("read_csv"):
+            data = pd.read_csv(file_path)
         
         # Find number columns only
-        number_columns = []
-        for col in data.columns:
-            if data[col].dtype in ['int64', 'float64']:
-                number_columns.append(col)
+        number_columns = find_number_columns(data)
         
-        if len(number_columns) == 0:
-            text_area.insert(tk.END, "No number columns found to analyze.\n")
-            return
-        
-        # Analyze each number column
-        text_area.insert(tk.END, "Analysis of number columns:\n")
-        text_area.insert(tk.END, "=" * 40 + "\n")
+        with stage("column_stats"):
+            stats = column_stats(data, number_columns)
         
-        for col in number_columns:
-            text_area.insert(tk.END, f"\nColumn: {col}\n")
-            text_area.insert(tk.END, f"Average: {data[col].mean():.2f}\n")
-            text_area.insert(tk.END, f"Highest: {data[col].max()}\n")
-            text_area.insert(tk.END, f"Lowest: {data[col].min()}\n")
-            text_area.insert(tk.END, f"Middle value: {data[col].median():.2f}\n")
+        with stage("show_results"):
+            show_results(data, number_columns, stats, text_area)
             
     except FileNotFoundError:
         messagebox.showerror("File Error", "The file was not found. Please check if the file exists.")
@@ -122,76 +151,77 @@ def clear_results():
             results_text.delete(1.0, tk.END)
             window.title("Simple CSV Analyzer")
 
-# Create the main window
-window = tk.Tk()
-window.title("Simple CSV Analyzer")
-window.geometry("750x520")
-window.minsize(600, 400)
-window.configure(bg="#f4f6fa")
-
-# Style configuration
-button_style = {
-    "font": ("Segoe UI", 11, "bold"),
-    "width": 16,
-    "height": 2,
-    "bd": 0,
-    "relief": tk.FLAT,
-    "activebackground": "#e0e7ef",
-    "cursor": "hand2"
-}
-
-# Create a frame for buttons
-button_frame = tk.Frame(window, bg="#f4f6fa")
-button_frame.pack(pady=18)
-
-choose_button = tk.Button(
-    button_frame,
-    text="📂  Choose CSV File",
-    command=choose_file,
-    bg="#4f8cff",
-    fg="white",
-    activeforeground="#222",
-    **button_style
-)
-choose_button.pack(side=tk.LEFT, padx=8)
-
-save_button = tk.Button(
-    button_frame,
-    text="💾  Save Results",
-    command=save_results,
-    bg="#43d19e",
-    fg="white",
-    activeforeground="#222",
-    **button_style
-)
-save_button.pack(side=tk.LEFT, padx=8)
-
-clear_button = tk.Button(
-    button_frame,
-    text="🗑️  Clear",
-    command=clear_results,
-    bg="#ff6b6b",
-    fg="white",
-    activeforeground="#222",
-    **button_style
-)
-clear_button.pack(side=tk.LEFT, padx=8)
-
-# Add text area to show results
-results_text = scrolledtext.ScrolledText(
-    window,
-    width=85,
-    height=24,
-    font=("Consolas", 11),
-    bg="#fafdff",
-    fg="#222",
-    bd=1,
-    relief=tk.FLAT,
-    padx=10,
-    pady=8,
-    wrap=tk.WORD
-)
-results_text.pack(padx=24, pady=12, fill=tk.BOTH, expand=True)
-
-# Start the program
-window.mainloop()
+if __name__ == "__main__":
+    # Create the main window
+    window = tk.Tk()
+    window.title("Simple CSV Analyzer")
+    window.geometry("750x520")
+    window.minsize(600, 400)
+    window.configure(bg="#f4f6fa")
+
+    # Style configuration
+    button_style = {
+        "font": ("Segoe UI", 11, "bold"),
+        "width": 16,
+        "height": 2,
+        "bd": 0,
+        "relief": tk.FLAT,
+        "activebackground": "#e0e7ef",
+        "cursor": "hand2"
+    }
+
+    # Create a frame for buttons
+    button_frame = tk.Frame(window, bg="#f4f6fa")
+    button_frame.pack(pady=18)
+
+    choose_button = tk.Button(
+        button_frame,
+        text="📂  Choose CSV File",
+        command=choose_file,
+        bg="#4f8cff",
+        fg="white",
+        activeforeground="#222",
+        **button_style
+    )
+    choose_button.pack(side=tk.LEFT, padx=8)
+
+    save_button = tk.Button(
+        button_frame,
+        text="💾  Save Results",
+        command=save_results,
+        bg="#43d19e",
+        fg="white",
+        activeforeground="#222",
+        **button_style
+    )
+    save_button.pack(side=tk.LEFT, padx=8)
+
+    clear_button = tk.Button(
+        button_frame,
+        text="🗑️  Clear",
+        command=clear_results,
+        bg="#ff6b6b",
+        fg="white",
+        activeforeground="#222",
+        **button_style
+    )
+    clear_button.pack(side=tk.LEFT, padx=8)
+
+    # Add text area to show results
+    results_text = scrolledtext.ScrolledText(
+        window,
+        width=85,
+        height=24,
+        font=("Consolas", 11),
+        bg="#fafdff",
+        fg="#222",
+        bd=1,
+        relief=tk.FLAT,
+        padx=10,
+        pady=8,
+        wrap=tk.WORD
+    )
+    results_text.pack(padx=24, pady=12, fill=tk.BOTH, expand=True)
+
+    # Start the program
+    window.mainloop()
@@ -0,0 +1,87 @@
+"""
+Synthetic datasets for the benchmarks
+Everything is seeded so the same size always produces the same data
+"""
+
+import csv
+import os
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+CATEGORIES = ["Rent", "Groceries", "Salary", "Transport", "Utilities",
+              "Dining", "Health", "Freelance", "Savings", "Fun"]
+REACTIONS = ["Thought-provoking", "Emotional", "Unsettling", "Powerful", "Intense"]
+
+
+def _cached(name, write):
+    """Return the path of a generated file, only generating it the first time"""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    path = os.path.join(DATA_DIR, name)
+    if not os.path.exists(path):
+        tmp_path = f"{path}.tmp"
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    return path
+
+
+def ledger_csv(rows, seed=0):
+    """Budget ledger in the budget_data.py format"""
+    def write(path):
+        rng = random.Random(seed)
+        start = date(2015, 1, 1)
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["date", "type", "category", "amount", "description"])
+            for i in range(rows):
+                day = start + timedelta(days=rng.randrange(3650))
+                entry_type = "income" if rng.random() < 0.3 else "expense"
+                writer.writerow([
+                    day.isoformat(),
+                    entry_type,
+                    rng.choice(CATEGORIES),
+                    f"{rng.uniform(1, 5000):.2f}",
+                    f"entry {i}",
+                ])
+    return _cached(f"ledger_{rows}.csv", write)
+
+
+def wide_csv(rows, columns=100, seed=0):
+    """Many numeric columns plus a couple of text ones, for analyze_csv_file"""
+    def write(path):
+        rng = np.random.default_rng(seed)
+        frame = pd.DataFrame(rng.normal(100, 25, size=(rows, columns)),
+                             columns=[f"metric_{i}" for i in range(columns)])
+        frame.insert(0, "label", rng.choice(CATEGORIES, size=rows))
+        frame.insert(1, "count", rng.integers(0, 1000, size=rows))
+        frame.to_csv(path, index=False)
+    return _cached(f"wide_{rows}x{columns}.csv", write)
+
+
+def long_csv(rows, seed=0):
+    """Tidy id/date/category/value rows, for analyze_csv_file"""
+    def write(path):
+        rng = np.random.default_rng(seed)
+        frame = pd.DataFrame({
+            "id": np.arange(rows),
+            "date": pd.Timestamp("2015-01-01") + pd.to_timedelta(rng.integers(0, 3650, size=rows), unit="D"),
+            "category": rng.choice(CATEGORIES, size=rows),
+            "value": rng.normal(50, 10, size=rows),
+            "quantity": rng.integers(1, 100, size=rows),
+        })
+        frame.to_csv(path, index=False)
+    return _cached(f"long_{rows}.csv", write)
+
+
+def ratings_matrix(friends, episodes=10, seed=0):
+    """Friends x episodes ratings and reactions in the project10.py layout"""
+    rng = np.random.default_rng(seed)
+    ratings = rng.integers(1, 11, size=(friends, episodes))
+    reactions = rng.choice(REACTIONS, size=(friends, episodes))
+    friend_names = [f"Friend {i}" for i in range(friends)]
+    episode_names = [f"Ep{i + 1}" for i in range(episodes)]
+    return ratings, reactions, friend_names, episode_names
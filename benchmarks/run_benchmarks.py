@@ -0,0 +1,364 @@
+"""
+Benchmark suite for the data paths
+Times load / query / aggregate / render stages on generated datasets and
+records the peak RSS of each case, with stored baselines for comparison
+
+    python benchmarks/run_benchmarks.py                      run the default sizes
+    python benchmarks/run_benchmarks.py --full               include the largest sizes (up to 10M rows)
+    python benchmarks/run_benchmarks.py --only budget --sizes 1k,1m
+    python benchmarks/run_benchmarks.py --save               store results as the baseline
+    python benchmarks/run_benchmarks.py --compare            fail if slower or bigger than the baseline
+
+Each case runs in a fresh process so its peak RSS is not inflated by earlier ones.
+
+There is no committed baseline, since timings depend on the machine. Create
+one on the machine that will run comparisons, from a known-good commit:
+
+    python benchmarks/run_benchmarks.py --save
+    git checkout <change> && python benchmarks/run_benchmarks.py --compare
+
+--compare counts cases missing from the baseline as failures, so run it with
+the same --only / --sizes / --full options the baseline was saved with.
+
+Stage names marked "bench-only" time code that exists only in this file (the
+tools themselves have no such step); "generate" times synthetic data creation.
+The temperature render stage is dominated by the calendar heatmap's one y tick
+label per week, not by the data, so its rows/s figure says little.
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import datasets
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+
+class TextSink:
+    """Stands in for the ScrolledText widget analyze_csv_file writes to"""
+
+    def __init__(self):
+        self.parts = []
+
+    def insert(self, index, text):
+        self.parts.append(text)
+
+    def delete(self, start, end=None):
+        self.parts.clear()
+
+    def get(self, start=None, end=None):
+        return "".join(self.parts)
+
+
+def _draw_open_figures():
+    """Rasterize every open figure; under Agg plt.show() never draws anything"""
+    import matplotlib.pyplot as plt
+
+    for number in plt.get_fignums():
+        plt.figure(number).canvas.draw()
+    plt.close("all")
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Send print() output to devnull so terminal speed doesn't skew timings"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def budget_stages(path, size):
+    import budget_data
+
+    state = {}
+
+    def load():
+        budget_data.FILENAME = path
+        state["data"] = budget_data.load_data()
+
+    def query():
+        with _quiet():
+            budget_data.view_records(state["data"], date_filter="2020-03")
+
+    def aggregate():
+        with _quiet():
+            budget_data.view_balance(state["data"])
+            budget_data.category_summary(state["data"])
+
+    def render():
+        with _quiet():
+            budget_data.view_records(state["data"])
+
+    def save():
+        # Write to devnull so the generated ledger is never overwritten and disk speed doesn't count
+        budget_data.FILENAME = os.devnull
+        budget_data.save_data(state["data"])
+
+    return [("load", load), ("query", query), ("aggregate", aggregate),
+            ("render", render), ("save", save)]
+
+
+def csv_stages(path, size):
+    import pandas as pd
+    import analyzeCSV
+
+    state = {}
+
+    # The same steps analyze_csv_file runs, timed one at a time
+    def load():
+        state["data"] = pd.read_csv(path)
+
+    def query():
+        state["columns"] = analyzeCSV.find_number_columns(state["data"])
+
+    def aggregate():
+        state["stats"] = analyzeCSV.column_stats(state["data"], state["columns"])
+
+    def render():
+        analyzeCSV.show_results(state["data"], state["columns"], state["stats"], TextSink())
+
+    return [("load", load), ("query", query), ("aggregate", aggregate), ("render", render)]
+
+
+def temperature_stages(path, size):
+    import matplotlib
+    matplotlib.use("Agg")
+    import numpy as np
+    from TemperatureDashboard import TemperatureAnalyzer
+
+    state = {}
+
+    def load():
+        state["analyzer"] = TemperatureAnalyzer(days=size)
+
+    def query():
+        temperatures = state["analyzer"].temperatures
+        state["hot_days"] = np.flatnonzero(temperatures > 30) + 1
+        state["cold_days"] = np.flatnonzero(temperatures < 20) + 1
+
+    def aggregate():
+        state["stats"] = state["analyzer"].analyze_data()
+
+    def render():
+        state["analyzer"].create_elegant_visualization()
+        _draw_open_figures()
+
+    return [("load", load), ("query (bench-only)", query), ("aggregate", aggregate),
+            ("render", render)]
+
+
+def ratings_stages(path, size):
+    import matplotlib
+    matplotlib.use("Agg")
+    import project10
+
+    state = {}
+
+    def generate():
+        state["ratings"], state["reactions"], state["friends"], state["episodes"] = \
+            datasets.ratings_matrix(size)
+
+    def query():
+        ratings = state["ratings"]
+        state["top_raters"] = ratings[ratings.max(axis=1) == 10]
+
+    def aggregate():
+        state["avg_ratings"] = project10.episode_averages(state["ratings"])
+        state["favorite"] = project10.favorite_episode(state["avg_ratings"])
+        avg_per_friend = project10.critic_averages(state["ratings"])
+        state["toughest"] = project10.toughest_critic(avg_per_friend)
+        state["counts"] = project10.reaction_counts(state["reactions"])
+
+    def render():
+        # The annotated heatmap is left out: one cell label per rating doesn't scale
+        project10.plot_episode_averages(state["episodes"], state["avg_ratings"])
+        project10.plot_reaction_counts(state["counts"])
+        _draw_open_figures()
+
+    return [("generate", generate), ("query (bench-only)", query), ("aggregate", aggregate),
+            ("render", render)]
+
+
+# name: (dataset file generator or None, stage builder, default sizes, extra sizes for --full)
+BENCHMARKS = {
+    "budget": (datasets.ledger_csv, budget_stages,
+               [1_000, 10_000, 100_000, 1_000_000], [10_000_000]),
+    "csv_wide": (datasets.wide_csv, csv_stages,
+                 [1_000, 10_000, 100_000], [1_000_000]),
+    "csv_long": (datasets.long_csv, csv_stages,
+                 [1_000, 10_000, 100_000, 1_000_000], [10_000_000]),
+    # Render time grows with the heatmap's weekly tick labels: ~6s at 10k days, ~90s at 100k
+    "temperature": (None, temperature_stages,
+                    [1_000, 10_000], [50_000]),
+    "ratings": (None, ratings_stages,
+                [1_000, 10_000, 100_000], [1_000_000]),
+}
+
+
+def parse_size(text):
+    """Turn '10k' / '1m' / '2500' into a row count"""
+    text = text.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    if multiplier != 1:
+        text = text[:-1]
+    return int(float(text) * multiplier)
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process, or None if it can't be measured"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return getattr(psutil.Process().memory_info(), "peak_wset", None)
+
+
+def run_case(name, size, path, repeat):
+    """Run every stage of one benchmark case; called in a fresh process"""
+    _, build_stages, _, _ = BENCHMARKS[name]
+    stages = build_stages(path, size)
+    results = {}
+    for stage_name, func in stages:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        results[stage_name] = {
+            "min_seconds": best,
+            "mean_seconds": sum(timings) / len(timings),
+            "rows_per_second": size / best if best > 0 else None,
+        }
+    return {"benchmark": name, "size": size, "stages": results,
+            "peak_rss_bytes": peak_rss_bytes()}
+
+
+def run_all(names, sizes, full, repeat):
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name in names:
+        make_dataset, _, default_sizes, full_sizes = BENCHMARKS[name]
+        case_sizes = sizes or default_sizes + (full_sizes if full else [])
+        for size in case_sizes:
+            print(f"{name} @ {size:,} rows ...", flush=True)
+            path = make_dataset(size) if make_dataset else None
+            with context.Pool(1) as pool:
+                result = pool.apply(run_case, (name, size, path, repeat))
+            results[f"{name}/{size}"] = result
+            print_result(result)
+    return results
+
+
+def print_result(result):
+    for stage_name, stage in result["stages"].items():
+        rate = stage["rows_per_second"]
+        rate_text = f"{rate:14,.0f} rows/s" if rate else ""
+        print(f"    {stage_name:<18} {stage['min_seconds']:10.4f}s {rate_text}")
+    if result["peak_rss_bytes"]:
+        print(f"    {'peak RSS':<18} {result['peak_rss_bytes'] / 2**20:10.1f} MiB")
+
+
+def compare(results, baseline, time_tolerance, memory_tolerance):
+    """Return a list of regressions against the baseline
+
+    Cases or stages the baseline doesn't have count as failures too, so a
+    comparison against an empty or unrelated baseline can't pass.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base:
+            regressions.append(f"{key}: not in the baseline")
+            continue
+        for stage_name, stage in result["stages"].items():
+            base_stage = base["stages"].get(stage_name)
+            if not base_stage:
+                regressions.append(f"{key} {stage_name}: not in the baseline")
+                continue
+            limit = base_stage["min_seconds"] * (1 + time_tolerance)
+            if stage["min_seconds"] > limit:
+                regressions.append(
+                    f"{key} {stage_name}: {stage['min_seconds']:.4f}s vs baseline "
+                    f"{base_stage['min_seconds']:.4f}s")
+        if result["peak_rss_bytes"] and base.get("peak_rss_bytes"):
+            limit = base["peak_rss_bytes"] * (1 + memory_tolerance)
+            if result["peak_rss_bytes"] > limit:
+                regressions.append(
+                    f"{key} peak RSS: {result['peak_rss_bytes'] / 2**20:.1f} MiB vs baseline "
+                    f"{base['peak_rss_bytes'] / 2**20:.1f} MiB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the project's data paths")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                        help="benchmarks to run (default: all)")
+    parser.add_argument("--sizes", help="comma separated row counts, e.g. 1k,100k,10m")
+    parser.add_argument("--full", action="store_true", help="also run the largest sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the fastest is kept")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE,
+                        help="store the results as the baseline")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE,
+                        help="compare against a stored baseline and fail on regressions")
+    parser.add_argument("--time-tolerance", type=float, default=0.2,
+                        help="allowed slowdown before a stage counts as a regression")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2,
+                        help="allowed peak RSS growth before a case counts as a regression")
+    args = parser.parse_args()
+
+    # Check before spending minutes on the run
+    if args.compare and not os.path.exists(args.compare):
+        sys.exit(f"Baseline file {args.compare} not found; create one with --save first.")
+
+    names = args.only or list(BENCHMARKS)
+    sizes = [parse_size(s) for s in args.sizes.split(",")] if args.sizes else None
+    results = run_all(names, sizes, args.full, args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.save:
+        # Merge so partial runs (--only / --sizes) update just their own cases
+        baseline = {}
+        if os.path.exists(args.save):
+            with open(args.save, "r", encoding="utf-8") as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+        if regressions:
+            print("\nFailures against the baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
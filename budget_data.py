@@ -2,8 +2,11 @@ import csv
 import os
 from datetime import datetime
 
+from profiling import profiled
+
 FILENAME = 'budget_data.csv'
 
+@profiled
 def load_data():
     data = []
     if os.path.exists(FILENAME):
@@ -14,6 +17,7 @@ def load_data():
                 data.append(row)
     return data
 
+@profiled
 def save_data(data):
     with open(FILENAME, 'w', newline='') as file:
         fieldnames = ['date', 'type', 'category', 'amount', 'description']
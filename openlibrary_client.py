@@ -0,0 +1,314 @@
+"""
+Open Library search client
+Pooled, rate limited and cached access to openlibrary.org/search.json
+"""
+
+import codecs
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+BASE_URL = "https://openlibrary.org"
+CACHE_DIR = ".openlibrary_cache"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class OpenLibraryClient:
+    """Search Open Library with connection pooling, paging, retries and caching"""
+
+    def __init__(self, base_url=BASE_URL, cache_dir=CACHE_DIR, cache_ttl=3600,
+                 max_workers=4, min_interval=0.2, max_retries=4,
+                 backoff=0.5, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        # One session shared by every worker so connections are reused
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def search(self, query, max_results=10, page_size=100):
+        """Return up to max_results docs for a query, paging as needed"""
+        page_size = min(page_size, max_results)
+        books = []
+        page = 1
+        while len(books) < max_results:
+            data = self.get_json("/search.json",
+                                 {"q": query, "page": page, "limit": page_size})
+            docs = data.get("docs", [])
+            books.extend(docs)
+            if len(docs) < page_size or len(books) >= data.get("numFound", 0):
+                break
+            page += 1
+        return books[:max_results]
+
+    def search_many(self, queries, max_results=10, page_size=100):
+        """Run several searches concurrently, returning {query: docs}"""
+        # Repeated queries are only fetched once
+        queries = list(dict.fromkeys(queries))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(lambda q: self.search(q, max_results, page_size), queries)
+            return dict(zip(queries, results))
+
+    def stream_search(self, query, limit=10, page_size=None, chunk_size=8192, use_ijson=None):
+        """Yield title/author records as the response arrives, stopping at limit
+
+        Each docs array is parsed one entry at a time and the connection is
+        closed as soon as enough records have been read, so large result
+        pages are never held in memory. Pages of page_size (default: limit)
+        are requested until limit records are yielded or a short page
+        arrives. use_ijson picks the parser; by default ijson is used when
+        installed. Streamed responses skip the cache.
+        """
+        if use_ijson is None:
+            use_ijson = ijson is not None
+        page_size = page_size or limit
+        url = f"{self.base_url}/search.json"
+        yielded = 0
+        page = 1
+        while yielded < limit:
+            params = {"q": query, "page": page, "limit": page_size}
+            with self._request(url, params, {}, stream=True) as response:
+                if use_ijson:
+                    response.raw.decode_content = True
+                    docs = ijson.items(response.raw, "docs.item")
+                else:
+                    docs = iter_docs(_iter_text(response.iter_content(chunk_size)))
+
+                page_count = 0
+                for book in docs:
+                    page_count += 1
+                    yielded += 1
+                    yield {
+                        "title": book.get("title"),
+                        "author": (book.get("author_name") or ["Unknown"])[0],
+                    }
+                    if yielded >= limit:
+                        return
+            if page_count < page_size:
+                return
+            page += 1
+
+    def get_json(self, path, params=None):
+        """GET a JSON document, serving it from the disk cache when possible"""
+        url = f"{self.base_url}{path}"
+        cached = self._read_cache(url, params)
+        if cached and time.time() - cached["fetched_at"] < self.cache_ttl:
+            return cached["data"]
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        response = self._request(url, params, headers)
+        if response.status_code == 304 and cached:
+            # Unchanged on the server, just extend the cached copy's lifetime
+            cached["fetched_at"] = time.time()
+            self._write_cache(url, params, cached)
+            return cached["data"]
+
+        data = response.json()
+        self._write_cache(url, params, {
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "data": data,
+        })
+        return data
+
+    def _request(self, url, params, headers, stream=False):
+        """Send a rate limited GET, retrying with exponential backoff"""
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_slot()
+            try:
+                response = self.session.get(url, params=params, headers=headers,
+                                            timeout=self.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self.backoff * 2 ** attempt
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+                response.close()
+                self._pause(delay)
+                continue
+
+            response.raise_for_status()
+            return response
+
+    def _wait_for_slot(self):
+        """Space requests at least min_interval seconds apart across threads"""
+        # Re-check after sleeping, another thread may have pushed the next slot back
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                wait = self._next_request_at - now
+                if wait <= 0:
+                    self._next_request_at = now + self.min_interval
+                    return
+            time.sleep(wait)
+
+    def _pause(self, delay):
+        """Hold back every worker for delay seconds after the server throttles us"""
+        with self._rate_lock:
+            self._next_request_at = max(self._next_request_at, time.monotonic() + delay)
+
+    def _cache_path(self, url, params):
+        key = json.dumps([url, sorted((params or {}).items())], default=str)
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _read_cache(self, url, params):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._cache_path(url, params), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, url, params, entry):
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(url, params)
+        # Write to a temp file first so concurrent readers never see half a file
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(tmp_path, path)
+
+
+def write_ndjson(records, file):
+    """Write records as one JSON object per line, flushing each so output is incremental"""
+    count = 0
+    for record in records:
+        file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        file.flush()
+        count += 1
+    return count
+
+
+def iter_docs(chunks):
+    """Yield the entries of the top-level "docs" array from an iterable of text chunks"""
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+
+    def fill():
+        # Drop what has been consumed and append the next chunk
+        nonlocal buf, pos
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek():
+        # Next non-whitespace character, or None at the end of the stream
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return None
+
+    def decode():
+        # Decode one complete JSON value, reading more chunks until it fits
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(buf) and isinstance(value, (int, float)) and fill():
+                continue
+            pos = end
+            return value
+
+    if peek() != "{":
+        raise ValueError("Expected a JSON object")
+    pos += 1
+
+    # Skip over top-level members until the docs array is reached
+    while True:
+        c = peek()
+        if c is None or c == "}":
+            return
+        if c == ",":
+            pos += 1
+            continue
+        key = decode()
+        if peek() != ":":
+            raise ValueError(f"Expected ':' after key {key!r}")
+        pos += 1
+        peek()
+        if key == "docs":
+            break
+        decode()
+
+    if peek() != "[":
+        return
+    pos += 1
+
+    while True:
+        c = peek()
+        if c is None or c == "]":
+            return
+        if c == ",":
+            pos += 1
+            continue
+        yield decode()
+
+
+def _iter_text(byte_chunks):
+    """Decode UTF-8 byte chunks without splitting multi-byte characters"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
@@ -0,0 +1,181 @@
+"""
+Lightweight stage profiling
+Per-stage wall time, CPU time and peak memory for the analysis tools
+
+Profiling is off unless PROFILE_LOG is set (or configure() is called):
+    PROFILE_LOG=stages.jsonl   one JSON record per stage call
+    PROFILE_LOG=stages.prom    Prometheus textfile with per-stage totals
+    PROFILE_CPROFILE=profiles  also dump a cProfile .prof file per top-level stage call
+    PROFILE_MEMORY=1           also track peak memory with tracemalloc
+
+Memory tracking slows down allocation-heavy code a lot, so wall and CPU
+times recorded with it on are not comparable to times recorded with it off.
+Each JSON record carries a memory_tracked flag for that reason.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_config = {
+    "enabled": False,
+    "log_path": None,
+    "prometheus": False,
+    "cprofile_dir": None,
+    "track_memory": False,
+}
+_stack = []
+_totals = {}
+_profile_counts = {}
+
+
+def configure(log_path=None, cprofile_dir=None, track_memory=False):
+    """Enable profiling, or disable it by passing no log_path"""
+    _config["enabled"] = bool(log_path)
+    _config["log_path"] = log_path
+    _config["prometheus"] = bool(log_path) and log_path.endswith(".prom")
+    _config["cprofile_dir"] = cprofile_dir
+    _config["track_memory"] = track_memory
+    _totals.clear()
+    _profile_counts.clear()
+
+
+def is_enabled():
+    return _config["enabled"]
+
+
+def profiled(func):
+    """Decorator that records a stage named after the function"""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Disabled path is a single dict lookup on top of the original call
+        if not _config["enabled"]:
+            return func(*args, **kwargs)
+        with stage(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def stage(name):
+    """Context manager that records one named stage, nested under any enclosing stage"""
+    if not _config["enabled"]:
+        yield
+        return
+
+    full_name = f"{_stack[-1]['name']}/{name}" if _stack else name
+    track_memory = _config["track_memory"]
+    started_tracing = False
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        # Keep the enclosing stage's peak before resetting it for this one
+        if _stack:
+            _stack[-1]["peak"] = max(_stack[-1]["peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        start_mem = tracemalloc.get_traced_memory()[0]
+    else:
+        start_mem = 0
+
+    profiler = None
+    if _config["cprofile_dir"] and not _stack:
+        profiler = cProfile.Profile()
+
+    frame = {"name": full_name, "peak": 0}
+    _stack.append(frame)
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+        _stack.pop()
+
+        peak = None
+        if track_memory:
+            peak_traced = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            peak = max(peak_traced - start_mem, 0)
+            if _stack:
+                _stack[-1]["peak"] = max(_stack[-1]["peak"], peak_traced)
+            elif started_tracing:
+                tracemalloc.stop()
+
+        if profiler:
+            os.makedirs(_config["cprofile_dir"], exist_ok=True)
+            # Number each call so repeated runs of a stage don't overwrite each other
+            count = _profile_counts[full_name] = _profile_counts.get(full_name, 0) + 1
+            file_name = full_name.replace("/", "__").replace("<", "").replace(">", "")
+            profiler.dump_stats(os.path.join(
+                _config["cprofile_dir"], f"{file_name}-{os.getpid()}-{count}.prof"))
+
+        _record(full_name, wall, cpu, peak)
+
+
+def _record(name, wall, cpu, peak):
+    """Append a stage result to the configured log"""
+    if _config["prometheus"]:
+        totals = _totals.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "peak": None})
+        totals["calls"] += 1
+        totals["wall"] += wall
+        totals["cpu"] += cpu
+        if peak is not None:
+            totals["peak"] = max(totals["peak"] or 0, peak)
+        _write_prometheus(_config["log_path"])
+    else:
+        record = {
+            "stage": name,
+            "wall_seconds": round(wall, 6),
+            "cpu_seconds": round(cpu, 6),
+            "peak_memory_bytes": peak,
+            "memory_tracked": peak is not None,
+            "timestamp": time.time(),
+        }
+        with open(_config["log_path"], "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+
+def _write_prometheus(path):
+    """Rewrite the Prometheus textfile with the running per-stage totals"""
+    metrics = [
+        ("stage_calls_total", "counter", "Number of times the stage ran", "calls"),
+        ("stage_wall_seconds_total", "counter", "Wall clock time spent in the stage", "wall"),
+        ("stage_cpu_seconds_total", "counter", "CPU time spent in the stage", "cpu"),
+        ("stage_peak_memory_bytes", "gauge", "Largest peak memory seen for the stage", "peak"),
+    ]
+    lines = []
+    for metric, kind, help_text, key in metrics:
+        if all(totals[key] is None for totals in _totals.values()):
+            continue
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, totals in _totals.items():
+            if totals[key] is None:
+                continue
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{metric}{{stage="{label}"}} {totals[key]}')
+
+    # node_exporter may read the file at any time, so replace it atomically
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+configure(
+    log_path=os.environ.get("PROFILE_LOG"),
+    cprofile_dir=os.environ.get("PROFILE_CPROFILE"),
+    track_memory=os.environ.get("PROFILE_MEMORY", "0") == "1",
+)
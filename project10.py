@@ -21,46 +21,75 @@ reactions = np.array([
     ["Powerful", "Emotional", "Powerful", "Thought-provoking"]
 ])
 
+
 # 1. Average score per episode
-avg_ratings = ratings.mean(axis=0)
-print("Average score per episode:")
-for ep, avg in zip(episodes, avg_ratings):
-    print(f"{ep}: {avg:.2f}")
+def episode_averages(ratings):
+    return ratings.mean(axis=0)
+
 
 # 2. Favorite episode
-fav_ep_idx = np.argmax(avg_ratings)
-print(f"\nFavorite episode: {episodes[fav_ep_idx]} (Avg score: {avg_ratings[fav_ep_idx]:.2f})")
+def favorite_episode(avg_ratings):
+    return np.argmax(avg_ratings)
+
 
 # 3. Toughest critic
-avg_per_friend = ratings.mean(axis=1)
-toughest_idx = np.argmin(avg_per_friend)
-print(f"\nToughest critic: {friends[toughest_idx]} (Avg rating given: {avg_per_friend[toughest_idx]:.2f})")
+def critic_averages(ratings):
+    return ratings.mean(axis=1)
+
+
+def toughest_critic(avg_per_friend):
+    return np.argmin(avg_per_friend)
+
+
+def reaction_counts(reactions):
+    return pd.Series(reactions.flatten()).value_counts()
+
 
 # 4. Visualizations
 
 # a) Bar plot: Average score per episode
-plt.figure(figsize=(6,4))
-sns.barplot(x=episodes, y=avg_ratings, palette="viridis")
-plt.ylim(0, 10)
-plt.ylabel("Average Rating")
-plt.title("Average Episode Ratings")
-plt.show()
+def plot_episode_averages(episodes, avg_ratings):
+    plt.figure(figsize=(6,4))
+    sns.barplot(x=episodes, y=avg_ratings, palette="viridis")
+    plt.ylim(0, 10)
+    plt.ylabel("Average Rating")
+    plt.title("Average Episode Ratings")
+    plt.show()
+
 
 # b) Heatmap: Who gave what ratings
-plt.figure(figsize=(8,5))
-sns.heatmap(ratings, annot=True, fmt="d", cmap="YlGnBu", xticklabels=episodes, yticklabels=friends)
-plt.title("Friends’ Ratings per Episode")
-plt.xlabel("Episode")
-plt.ylabel("Friend")
-plt.show()
+def plot_ratings_heatmap(ratings, friends, episodes):
+    plt.figure(figsize=(8,5))
+    sns.heatmap(ratings, annot=True, fmt="d", cmap="YlGnBu", xticklabels=episodes, yticklabels=friends)
+    plt.title("Friends’ Ratings per Episode")
+    plt.xlabel("Episode")
+    plt.ylabel("Friend")
+    plt.show()
+
 
 # c) Count plot: Reaction frequencies
+def plot_reaction_counts(counts):
+    plt.figure(figsize=(8,4))
+    sns.barplot(x=counts.index, y=counts.values, palette="coolwarm")
+    plt.ylabel("Frequency")
+    plt.title("Reaction Frequencies")
+    plt.xticks(rotation=30)
+    plt.show()
+
+
+if __name__ == "__main__":
+    avg_ratings = episode_averages(ratings)
+    print("Average score per episode:")
+    for ep, avg in zip(episodes, avg_ratings):
+        print(f"{ep}: {avg:.2f}")
+
+    fav_ep_idx = favorite_episode(avg_ratings)
+    print(f"\nFavorite episode: {episodes[fav_ep_idx]} (Avg score: {avg_ratings[fav_ep_idx]:.2f})")
+
+    avg_per_friend = critic_averages(ratings)
+    toughest_idx = toughest_critic(avg_per_friend)
+    print(f"\nToughest critic: {friends[toughest_idx]} (Avg rating given: {avg_per_friend[toughest_idx]:.2f})")
 
-reactions_flat = reactions.flatten()
-reaction_counts = pd.Series(reactions_flat).value_counts()
-plt.figure(figsize=(8,4))
-sns.barplot(x=reaction_counts.index, y=reaction_counts.values, palette="coolwarm")
-plt.ylabel("Frequency")
-plt.title("Reaction Frequencies")
-plt.xticks(rotation=30)
-plt.show()
\ No newline at end of file
+    plot_episode_averages(episodes, avg_ratings)
+    plot_ratings_heatmap(ratings, friends, episodes)
+    plot_reaction_counts(reaction_counts(reactions))
\ No newline at end of file
@@ -25,22 +25,27 @@ soup.select("tr[itemtype='http://schema.org/Book']")[:10]:
 
 
 
-import requests
+import sys
 
-query = "comedy"
-url = f"https://openlibrary.org/search.json?q={query}"
+import requests
 
-try:
-    response = requests.get(url)
-    response.raise_for_status()
+from openlibrary_client import OpenLibraryClient, write_ndjson
 
-    data = response.json()
-    books = data.get("docs", [])
+queries = ["comedy"]
 
-    for book in books[:10]:
-        title = book.get("title")
-        author = book.get("author_name", ["Unknown"])[0]
-        print(f"{title} — {author}")
+try:
+    with OpenLibraryClient() as client:
+        if "--stream" in sys.argv:
+            # Print NDJSON records as they are parsed instead of waiting for the whole page
+            for query in queries:
+                write_ndjson(client.stream_search(query, limit=10), sys.stdout)
+        else:
+            results = client.search_many(queries, max_results=10)
+
+            for query, books in results.items():
+                for book in books:
+                    title = book.get("title")
+                    author = book.get("author_name", ["Unknown"])[0]
+                    print(f"{title} — {author}")
 except requests.RequestException as e:
     print(f"Request failed: {e}")
-
@@ -0,0 +1,52 @@
+import pytest
+
+from benchmarks.run_benchmarks import compare, parse_size
+
+
+def result(seconds, rss=100 * 2**20, stages=("load",)):
+    return {"stages": {name: {"min_seconds": seconds} for name in stages}, "peak_rss_bytes": rss}
+
+
+@pytest.mark.parametrize("text, rows", [
+    ("2500", 2_500), ("1k", 1_000), ("1.5K", 1_500), ("10m", 10_000_000), (" 100k ", 100_000),
+])
+def test_parse_size(text, rows):
+    assert parse_size(text) == rows
+
+
+def test_compare_within_tolerance_passes():
+    baseline = {"budget/1000": result(1.0)}
+    assert compare({"budget/1000": result(1.19, rss=119 * 2**20)}, baseline, 0.2, 0.2) == []
+
+
+def test_compare_flags_slower_stage():
+    baseline = {"budget/1000": result(1.0)}
+    failures = compare({"budget/1000": result(1.21)}, baseline, 0.2, 0.2)
+    assert failures == ["budget/1000 load: 1.2100s vs baseline 1.0000s"]
+
+
+def test_compare_flags_rss_growth():
+    baseline = {"budget/1000": result(1.0)}
+    failures = compare({"budget/1000": result(1.0, rss=121 * 2**20)}, baseline, 0.2, 0.2)
+    assert failures == ["budget/1000 peak RSS: 121.0 MiB vs baseline 100.0 MiB"]
+
+
+def test_compare_skips_rss_when_unmeasured():
+    baseline = {"budget/1000": result(1.0, rss=None)}
+    assert compare({"budget/1000": result(1.0, rss=500 * 2**20)}, baseline, 0.2, 0.2) == []
+
+
+def test_compare_fails_missing_case_and_stage():
+    baseline = {"budget/1000": result(1.0)}
+    results = {
+        "budget/1000": result(1.0, stages=("load", "save")),
+        "ratings/1000": result(1.0),
+    }
+    assert compare(results, baseline, 0.2, 0.2) == [
+        "budget/1000 save: not in the baseline",
+        "ratings/1000: not in the baseline",
+    ]
+    assert compare(results, {}, 0.2, 0.2) == [
+        "budget/1000: not in the baseline",
+        "ratings/1000: not in the baseline",
+    ]
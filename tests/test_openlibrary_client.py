@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from openlibrary_client import OpenLibraryClient
+
+DOCS = [{"title": f"Book {i}", "author_name": [f"Author {i}"]} for i in range(250)]
+
+
+def serve_pages(handler, query):
+    page = int(query.get("page", 1))
+    limit = int(query.get("limit", 100))
+    start = (page - 1) * limit
+    handler.send_json({"numFound": len(DOCS), "docs": DOCS[start:start + limit]})
+
+
+def make_client(server, **kwargs):
+    kwargs.setdefault("cache_dir", None)
+    return OpenLibraryClient(base_url=server.url, min_interval=0, backoff=0.01, **kwargs)
+
+
+def test_search_pages_until_max_results(stub_server):
+    stub_server.respond = serve_pages
+    with make_client(stub_server) as client:
+        books = client.search("comedy", max_results=230, page_size=100)
+
+    assert books == DOCS[:230]
+    assert [r["query"]["page"] for r in stub_server.seen] == ["1", "2", "3"]
+    assert {r["query"]["limit"] for r in stub_server.seen} == {"100"}
+
+
+def test_cache_hit_within_ttl_makes_no_request(stub_server, tmp_path):
+    stub_server.respond = serve_pages
+    with make_client(stub_server, cache_dir=str(tmp_path)) as client:
+        first = client.search("comedy")
+        second = client.search("comedy")
+
+    assert first == second == DOCS[:10]
+    assert len(stub_server.seen) == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(stub_server, tmp_path):
+    def respond(handler, query):
+        if handler.headers.get("If-None-Match") == '"v1"':
+            handler.send_response(304)
+            handler.end_headers()
+        else:
+            handler.send_json({"numFound": 1, "docs": DOCS[:1]}, headers={"ETag": '"v1"'})
+
+    stub_server.respond = respond
+    with make_client(stub_server, cache_dir=str(tmp_path), cache_ttl=0) as client:
+        first = client.search("comedy")
+        second = client.search("comedy")
+
+    assert first == second == DOCS[:1]
+    assert "If-None-Match" not in stub_server.seen[0]["headers"]
+    assert stub_server.seen[1]["headers"]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retry_honors_retry_after(stub_server, status):
+    def respond(handler, query):
+        if len(stub_server.seen) == 1:
+            handler.send_json({}, status=status, headers={"Retry-After": "1"})
+        else:
+            serve_pages(handler, query)
+
+    stub_server.respond = respond
+    start = time.monotonic()
+    with make_client(stub_server) as client:
+        books = client.search("comedy")
+
+    assert books == DOCS[:10]
+    assert len(stub_server.seen) == 2
+    assert time.monotonic() - start >= 1
+
+
+def test_search_many_collapses_duplicate_queries(stub_server):
+    stub_server.respond = serve_pages
+    with make_client(stub_server) as client:
+        results = client.search_many(["comedy", "drama", "comedy"])
+
+    assert list(results) == ["comedy", "drama"]
+    assert sorted(r["query"]["q"] for r in stub_server.seen) == ["comedy", "drama"]
+
+
+def test_retry_after_holds_back_every_worker(stub_server):
+    def respond(handler, query):
+        stub_server.times.append(time.monotonic())
+        if len(stub_server.seen) == 1:
+            handler.send_json({}, status=429, headers={"Retry-After": "1"})
+        else:
+            serve_pages(handler, query)
+
+    stub_server.times = []
+    stub_server.respond = respond
+    with OpenLibraryClient(base_url=stub_server.url, cache_dir=None, min_interval=0.2,
+                           backoff=0.01, max_workers=3) as client:
+        results = client.search_many(["comedy", "drama", "poetry"])
+
+    assert all(books == DOCS[:10] for books in results.values())
+    throttled_at = stub_server.times[0]
+    assert all(t >= throttled_at + 0.95 for t in stub_server.times[1:])
@@ -0,0 +1,108 @@
+import io
+import json
+import threading
+
+import pytest
+import requests
+
+import openlibrary_client
+from openlibrary_client import OpenLibraryClient, iter_docs, write_ndjson, _iter_text
+
+PARSERS = [
+    pytest.param(False, id="iter_docs"),
+    pytest.param(True, id="ijson", marks=pytest.mark.skipif(
+        openlibrary_client.ijson is None, reason="ijson not installed")),
+]
+
+@pytest.fixture(scope="module")
+def large_docs():
+    return [{"title": f"Book {i}", "author_name": [f"Author {i}"], "subject": ["x" * 150]}
+            for i in range(100_000)]
+
+
+@pytest.fixture(scope="module")
+def large_body(large_docs):
+    # Roughly 20 MB, far more than the socket buffers, so an early close is visible server side
+    return json.dumps({"numFound": len(large_docs), "q": "docs", "docs": large_docs}).encode("utf-8")
+
+
+def to_records(docs):
+    return [{"title": d.get("title"), "author": (d.get("author_name") or ["Unknown"])[0]} for d in docs]
+
+
+def make_client(server):
+    return OpenLibraryClient(base_url=server.url, cache_dir=None, min_interval=0, backoff=0.01)
+
+
+@pytest.fixture
+def large_server(stub_server, large_body):
+    """Always serves the whole large page, ignoring limit, and records whether the client hung up"""
+    stub_server.aborted = []
+    stub_server.finished = threading.Event()
+
+    def respond(handler, query):
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(large_body)))
+        handler.end_headers()
+        try:
+            for start in range(0, len(large_body), 65536):
+                handler.wfile.write(large_body[start:start + 65536])
+            stub_server.aborted.append(False)
+        except (BrokenPipeError, ConnectionResetError):
+            stub_server.aborted.append(True)
+        finally:
+            stub_server.finished.set()
+
+    stub_server.respond = respond
+    return stub_server
+
+
+@pytest.mark.parametrize("use_ijson", PARSERS)
+def test_stream_matches_full_decode_and_closes_early(large_server, large_docs, use_ijson):
+    expected = to_records(requests.get(f"{large_server.url}/search.json").json()["docs"][:150])
+    large_server.finished.clear()
+    large_server.aborted.clear()
+
+    with make_client(large_server) as client:
+        records = list(client.stream_search("comedy", limit=150, page_size=len(large_docs),
+                                            use_ijson=use_ijson))
+
+    assert records == expected
+    assert large_server.finished.wait(10)
+    assert large_server.aborted == [True]
+
+
+@pytest.mark.parametrize("use_ijson", PARSERS)
+def test_stream_pages_past_one_page(stub_server, large_docs, use_ijson):
+    docs = large_docs[:250]
+
+    def respond(handler, query):
+        page, limit = int(query["page"]), int(query["limit"])
+        handler.send_json({"numFound": len(docs), "docs": docs[(page - 1) * limit:page * limit]})
+
+    stub_server.respond = respond
+    with make_client(stub_server) as client:
+        assert list(client.stream_search("s", limit=150, use_ijson=use_ijson)) == to_records(docs[:150])
+        assert list(client.stream_search("s", limit=150, page_size=100,
+                                         use_ijson=use_ijson)) == to_records(docs[:150])
+        assert list(client.stream_search("s", limit=400, page_size=100,
+                                         use_ijson=use_ijson)) == to_records(docs)
+
+    assert [r["query"]["page"] for r in stub_server.seen] == ["1", "1", "2", "1", "2", "3"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_docs_handles_any_chunking(chunk_size):
+    payload = {"q": "docs \"x\"", "nested": {"docs": [1]}, "n": 12345,
+               "docs": [{"title": "é", "v": [1.5, {"a": "]"}]}, {"title": "b"}], "tail": 1}
+    raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    chunks = [raw[i:i + chunk_size] for i in range(0, len(raw), chunk_size)]
+
+    assert list(iter_docs(_iter_text(chunks))) == payload["docs"]
+
+
+def test_write_ndjson():
+    out = io.StringIO()
+    assert write_ndjson(iter([{"title": "a"}, {"title": "é"}]), out) == 2
+    assert out.getvalue() == '{"title": "a"}\n{"title": "é"}\n'
@@ -0,0 +1,88 @@
+import json
+import os
+
+import pytest
+
+import profiling
+from profiling import configure, profiled, stage
+
+
+@pytest.fixture(autouse=True)
+def reset_profiling():
+    yield
+    configure()
+
+
+@profiled
+def outer():
+    with stage("inner"):
+        inner_block = bytearray(4_000_000)
+    outer_block = bytearray(1_000_000)
+    return len(inner_block) + len(outer_block)
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_disabled_is_a_pass_through(tmp_path):
+    configure()
+    assert not profiling.is_enabled()
+    assert outer() == 5_000_000
+    assert outer.__name__ == "outer"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_jsonl_records_nested_stages_without_memory(tmp_path):
+    log = tmp_path / "stages.jsonl"
+    configure(str(log))
+    outer()
+
+    records = read_jsonl(log)
+    assert [r["stage"] for r in records] == ["outer/inner", "outer"]
+    for record in records:
+        assert record["memory_tracked"] is False
+        assert record["peak_memory_bytes"] is None
+        assert record["wall_seconds"] >= 0 and record["cpu_seconds"] >= 0
+
+
+def test_inner_peak_carries_over_to_outer(tmp_path):
+    log = tmp_path / "stages.jsonl"
+    configure(str(log), track_memory=True)
+    outer()
+
+    inner, outer_record = read_jsonl(log)
+    assert inner["memory_tracked"] and outer_record["memory_tracked"]
+    assert inner["peak_memory_bytes"] >= 4_000_000
+    # The inner block is freed before the outer one is allocated, yet the outer peak still includes it
+    assert outer_record["peak_memory_bytes"] >= inner["peak_memory_bytes"]
+
+
+def test_prometheus_escapes_labels_and_skips_unmeasured(tmp_path):
+    prom = tmp_path / "stages.prom"
+    configure(str(prom))
+    with stage('say "hi"\\now'):
+        pass
+    with stage('say "hi"\\now'):
+        pass
+
+    text = prom.read_text(encoding="utf-8")
+    assert 'stage_calls_total{stage="say \\"hi\\"\\\\now"} 2' in text
+    assert "stage_wall_seconds_total" in text
+    assert "stage_peak_memory_bytes" not in text
+
+    configure(str(prom), track_memory=True)
+    with stage("measured"):
+        pass
+    assert 'stage_peak_memory_bytes{stage="measured"}' in prom.read_text(encoding="utf-8")
+
+
+def test_cprofile_dumps_are_numbered_per_call(tmp_path):
+    profiles = tmp_path / "profiles"
+    configure(str(tmp_path / "stages.jsonl"), cprofile_dir=str(profiles))
+    outer()
+    outer()
+
+    names = sorted(os.listdir(profiles))
+    assert names == [f"outer-{os.getpid()}-1.prof", f"outer-{os.getpid()}-2.prof"]